@@ -1,9 +1,32 @@
 import json
+import gzip
 import boto3
+from botocore.config import Config
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Callable, Dict, List, Any, Optional
 import re
 
+# Clients are built during the Lambda init phase so botocore loads the
+# bedrock-runtime and s3 service models before the first invocation and
+# warm containers reuse them instead of rebuilding per request
+BEDROCK_RUNTIME = boto3.client(
+    'bedrock-runtime',
+    # Adaptive mode retries ThrottlingException with backoff and client-side
+    # rate limiting; the handlers' fallbacks only apply once retries run out
+    config=Config(
+        retries={'mode': 'adaptive', 'max_attempts': 5},
+        connect_timeout=5,
+        read_timeout=30
+    )
+)
+S3_CLIENT = boto3.client('s3')
+
+CLAUDE_MODEL_ID = 'anthropic.claude-3-sonnet-20240229-v1:0'
+
+# Upper bounds on input text sent to Bedrock; larger payloads are rejected
+MAX_RESUME_CHARS = 50_000
+MAX_JOB_DESCRIPTION_CHARS = 20_000
+
 def lambda_handler(event, context):
     """
     AWS Lambda function for AI-powered resume optimization
@@ -11,6 +34,9 @@ def lambda_handler(event, context):
     """
     
     try:
+        # Capture the invocation time once for both the response and S3 keys
+        invoked_at = datetime.now()
+        
         # Extract parameters from event
         user_resume = event.get('user_resume', '')
         job_description = event.get('job_description', '')
@@ -18,9 +44,31 @@ def lambda_handler(event, context):
         company_name = event.get('company_name', '')
         user_profile = event.get('user_profile', {})
         
-        # Initialize AWS clients
-        bedrock_runtime = boto3.client('bedrock-runtime')
-        s3_client = boto3.client('s3')
+        # Fail fast before spending Bedrock tokens on unusable input
+        if not user_resume or not job_description:
+            return {
+                'statusCode': 400,
+                'body': json.dumps({
+                    'error': 'user_resume and job_description are required',
+                    'message': 'Failed to optimize resume and cover letter'
+                })
+            }
+        
+        for field, value, limit in (
+            ('user_resume', user_resume, MAX_RESUME_CHARS),
+            ('job_description', job_description, MAX_JOB_DESCRIPTION_CHARS)
+        ):
+            if len(value) > limit:
+                return {
+                    'statusCode': 413,
+                    'body': json.dumps({
+                        'error': f'{field} exceeds {limit} characters',
+                        'message': 'Failed to optimize resume and cover letter'
+                    })
+                }
+        
+        bedrock_runtime = BEDROCK_RUNTIME
+        s3_client = S3_CLIENT
         
         # Generate optimized resume
         optimized_resume = optimize_resume_with_ai(
@@ -40,7 +88,7 @@ def lambda_handler(event, context):
         # Store optimized documents in S3
         document_urls = store_documents(
             s3_client, optimized_resume, cover_letter, 
-            user_profile.get('user_id'), job_title, company_name
+            user_profile.get('user_id'), job_title, company_name, invoked_at
         )
         
         # Prepare response
@@ -51,7 +99,7 @@ def lambda_handler(event, context):
                 'cover_letter': cover_letter,
                 'application_insights': application_insights,
                 'document_urls': document_urls,
-                'optimization_timestamp': datetime.now().isoformat()
+                'optimization_timestamp': invoked_at.isoformat()
             })
         }
         
@@ -66,6 +114,74 @@ def lambda_handler(event, context):
             })
         }
 
+def _extract_json(text: str) -> Optional[Dict[str, Any]]:
+    """Pull the first balanced, parseable JSON object out of a model reply that wraps it in prose"""
+    
+    start = text.find('{')
+    while start != -1:
+        depth = 0
+        in_string = False
+        escaped = False
+        for i in range(start, len(text)):
+            char = text[i]
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif char == '\\':
+                    escaped = True
+                elif char == '"':
+                    in_string = False
+            elif char == '"':
+                in_string = True
+            elif char == '{':
+                depth += 1
+            elif char == '}':
+                depth -= 1
+                if depth == 0:
+                    try:
+                        return json.loads(text[start:i + 1])
+                    except json.JSONDecodeError:
+                        break
+        
+        # Unparseable or unclosed span, e.g. a "{placeholder}" in the prose;
+        # retry from the next opening brace
+        start = text.find('{', start + 1)
+    return None
+
+def _invoke_claude(bedrock_runtime, prompt: str, max_tokens: int,
+                   fallback: Callable[[str], Dict[str, Any]],
+                   model_id: str = CLAUDE_MODEL_ID) -> Dict[str, Any]:
+    """Send a single-turn prompt to Claude and return its JSON reply as a dict
+    
+    fallback receives the raw reply text when no JSON object can be recovered
+    from it. Bedrock errors propagate so callers can choose their own defaults.
+    """
+    
+    response = bedrock_runtime.invoke_model(
+        modelId=model_id,
+        body=json.dumps({
+            'anthropic_version': 'bedrock-2023-05-31',
+            'max_tokens': max_tokens,
+            'messages': [
+                {
+                    'role': 'user',
+                    'content': prompt
+                }
+            ]
+        })
+    )
+    
+    response_body = json.loads(response['body'].read())
+    ai_response = response_body['content'][0]['text']
+    
+    # Parse JSON response
+    try:
+        return json.loads(ai_response)
+    except json.JSONDecodeError:
+        result = _extract_json(ai_response)
+    
+    return result if result is not None else fallback(ai_response)
+
 def optimize_resume_with_ai(bedrock_runtime, user_resume: str, job_description: str, 
                            job_title: str, company_name: str) -> Dict[str, Any]:
     """Use Claude to optimize resume for specific job application"""
@@ -106,36 +222,16 @@ def optimize_resume_with_ai(bedrock_runtime, user_resume: str, job_description:
     """
     
     try:
-        response = bedrock_runtime.invoke_model(
-            modelId='anthropic.claude-3-sonnet-20240229-v1:0',
-            body=json.dumps({
-                'anthropic_version': 'bedrock-2023-05-31',
-                'max_tokens': 2000,
-                'messages': [
-                    {
-                        'role': 'user',
-                        'content': prompt
-                    }
-                ]
-            })
-        )
-        
-        response_body = json.loads(response['body'].read())
-        ai_response = response_body['content'][0]['text']
-        
-        # Parse JSON response
-        try:
-            optimization_result = json.loads(ai_response)
-        except json.JSONDecodeError:
+        return _invoke_claude(
+            bedrock_runtime, prompt, 2000,
             # Fallback if JSON parsing fails
-            optimization_result = {
+            lambda ai_response: {
                 "optimized_content": ai_response,
                 "changes_summary": ["AI optimization applied"],
                 "ats_score": 7,
                 "recommendations": ["Review the optimized content carefully"]
             }
-        
-        return optimization_result
+        )
         
     except Exception as e:
         # Fallback optimization
@@ -159,7 +255,7 @@ def generate_cover_letter(bedrock_runtime, user_profile: Dict, job_description:
     - Job Domain: {user_profile.get('job_domain', 'Software Engineering')}
     - Experience Level: {user_profile.get('experience_level', 'Entry Level')}
     - Skills: {user_profile.get('skills', 'Programming, Problem Solving')}
-    - Education: {user_profile.get('education', 'Bachelor\'s Degree')}
+    - Education: {user_profile.get("education", "Bachelor's Degree")}
 
     JOB DETAILS:
     - Position: {job_title}
@@ -189,34 +285,14 @@ def generate_cover_letter(bedrock_runtime, user_profile: Dict, job_description:
     """
     
     try:
-        response = bedrock_runtime.invoke_model(
-            modelId='anthropic.claude-3-sonnet-20240229-v1:0',
-            body=json.dumps({
-                'anthropic_version': 'bedrock-2023-05-31',
-                'max_tokens': 1500,
-                'messages': [
-                    {
-                        'role': 'user',
-                        'content': prompt
-                    }
-                ]
-            })
-        )
-        
-        response_body = json.loads(response['body'].read())
-        ai_response = response_body['content'][0]['text']
-        
-        # Parse JSON response
-        try:
-            cover_letter_result = json.loads(ai_response)
-        except json.JSONDecodeError:
-            cover_letter_result = {
+        return _invoke_claude(
+            bedrock_runtime, prompt, 1500,
+            lambda ai_response: {
                 "cover_letter": ai_response,
                 "key_selling_points": ["Relevant experience", "Strong skills match"],
                 "personalization_score": 7
             }
-        
-        return cover_letter_result
+        )
         
     except Exception as e:
         # Fallback cover letter template
@@ -262,31 +338,11 @@ def analyze_application_strategy(bedrock_runtime, job_description: str, user_pro
     """
     
     try:
-        response = bedrock_runtime.invoke_model(
-            modelId='anthropic.claude-3-sonnet-20240229-v1:0',
-            body=json.dumps({
-                'anthropic_version': 'bedrock-2023-05-31',
-                'max_tokens': 1000,
-                'messages': [
-                    {
-                        'role': 'user',
-                        'content': prompt
-                    }
-                ]
-            })
+        return _invoke_claude(
+            bedrock_runtime, prompt, 1000,
+            lambda ai_response: generate_fallback_insights(user_profile)
         )
         
-        response_body = json.loads(response['body'].read())
-        ai_response = response_body['content'][0]['text']
-        
-        # Parse JSON response
-        try:
-            strategy_insights = json.loads(ai_response)
-        except json.JSONDecodeError:
-            strategy_insights = generate_fallback_insights(user_profile)
-        
-        return strategy_insights
-        
     except Exception as e:
         return generate_fallback_insights(user_profile)
 
@@ -332,43 +388,48 @@ def generate_fallback_insights(user_profile: Dict) -> Dict[str, Any]:
     }
 
 def store_documents(s3_client, optimized_resume: Dict, cover_letter: Dict, 
-                   user_id: str, job_title: str, company_name: str) -> Dict[str, str]:
+                   user_id: str, job_title: str, company_name: str,
+                   invoked_at: datetime) -> Dict[str, str]:
     """Store optimized documents in S3"""
     
     try:
         bucket_name = 'ai-career-agent-documents'  # Configure your S3 bucket
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = invoked_at.strftime("%Y%m%d_%H%M%S")
         
         # Clean company name for filename
         clean_company = re.sub(r'[^\w\s-]', '', company_name).strip()
         clean_company = re.sub(r'[-\s]+', '_', clean_company)
         
-        # Store resume
-        resume_key = f'resumes/{user_id}/{clean_company}_{timestamp}_resume.json'
-        s3_client.put_object(
-            Bucket=bucket_name,
-            Key=resume_key,
-            Body=json.dumps(optimized_resume),
-            ContentType='application/json'
-        )
-        
-        # Store cover letter
-        cover_letter_key = f'cover_letters/{user_id}/{clean_company}_{timestamp}_cover_letter.json'
+        # Store resume and cover letter together as one gzipped object so each
+        # optimization costs a single PUT request
+        bundle_key = f'bundles/{user_id}/{clean_company}_{timestamp}.json.gz'
+        bundle = {
+            'resume': optimized_resume,
+            'cover_letter': cover_letter,
+            'meta': {
+                'user_id': user_id,
+                'job_title': job_title,
+                'company_name': company_name,
+                'created_at': invoked_at.isoformat()
+            }
+        }
         s3_client.put_object(
             Bucket=bucket_name,
-            Key=cover_letter_key,
-            Body=json.dumps(cover_letter),
-            ContentType='application/json'
+            Key=bundle_key,
+            Body=gzip.compress(json.dumps(bundle).encode('utf-8'), compresslevel=1),
+            ContentType='application/json',
+            ContentEncoding='gzip'
         )
         
+        # Consumers read the bundle and pick each document out by its key
         return {
-            'resume_url': f's3://{bucket_name}/{resume_key}',
-            'cover_letter_url': f's3://{bucket_name}/{cover_letter_key}'
+            'bundle_url': f's3://{bucket_name}/{bundle_key}',
+            'resume_key': 'resume',
+            'cover_letter_key': 'cover_letter'
         }
         
     except Exception as e:
         print(f"Failed to store documents in S3: {str(e)}")
         return {
-            'resume_url': 'Storage failed',
-            'cover_letter_url': 'Storage failed'
+            'bundle_url': 'Storage failed'
         }
\ No newline at end of file
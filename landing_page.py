@@ -1,11 +1,6 @@
 import streamlit as st
-import json
-from datetime import datetime, timedelta
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from typing import Dict, List, Optional
-import time
+import re
+import os
 
 # Configure Streamlit page
 st.set_page_config(
@@ -15,615 +10,96 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
-# Custom CSS for professional landing page
-st.markdown("""
-<style>
-    /* Import Google Fonts */
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&display=swap');
-    
-    /* Global Styles */
-    * {
-        margin: 0;
-        padding: 0;
-        box-sizing: border-box;
-    }
-    
-    .main {
-        font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-        padding: 0 !important;
-    }
-    
-    /* Color Variables */
-    :root {
-        --primary-blue: #103778;
-        --primary-teal: #0593A2;
-        --accent-orange: #FF7A48;
-        --accent-yellow: #FFD700;
-        --text-dark: #1a1a1a;
-        --text-gray: #666666;
-        --bg-light: #f8fafc;
-        --white: #ffffff;
-    }
-    
-    /* Header Navigation */
-    .header-nav {
-        background: var(--white);
-        padding: 1rem 2rem;
-        box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        position: sticky;
-        top: 0;
-        z-index: 1000;
-    }
-    
-    .nav-container {
-        max-width: 1200px;
-        margin: 0 auto;
-        display: flex;
-        justify-content: space-between;
-        align-items: center;
-    }
-    
-    .logo {
-        display: flex;
-        align-items: center;
-        gap: 0.5rem;
-        font-size: 1.5rem;
-        font-weight: 700;
-        color: var(--primary-blue);
-    }
-    
-    .nav-menu {
-        display: flex;
-        gap: 2rem;
-        align-items: center;
-    }
-    
-    .nav-item {
-        color: var(--text-dark);
-        text-decoration: none;
-        font-weight: 500;
-        transition: color 0.3s ease;
-        cursor: pointer;
-    }
-    
-    .nav-item:hover {
-        color: var(--primary-teal);
-    }
-    
-    .cta-button {
-        background: linear-gradient(135deg, var(--accent-yellow) 0%, #FFA500 100%);
-        color: var(--text-dark);
-        padding: 0.75rem 1.5rem;
-        border-radius: 25px;
-        text-decoration: none;
-        font-weight: 600;
-        transition: transform 0.3s ease, box-shadow 0.3s ease;
-        border: none;
-        cursor: pointer;
-    }
-    
-    .cta-button:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 8px 25px rgba(255, 215, 0, 0.4);
-    }
-    
-    /* Hero Section */
-    .hero-section {
-        background: linear-gradient(135deg, #f8fafc 0%, #e2e8f0 100%);
-        padding: 4rem 2rem;
-        min-height: 80vh;
-        display: flex;
-        align-items: center;
-    }
-    
-    .hero-container {
-        max-width: 1200px;
-        margin: 0 auto;
-        display: grid;
-        grid-template-columns: 1fr 1fr;
-        gap: 4rem;
-        align-items: center;
-    }
-    
-    .hero-content {
-        padding-right: 2rem;
-    }
-    
-    .hero-tagline {
-        color: var(--primary-teal);
-        font-size: 0.9rem;
-        font-weight: 600;
-        text-transform: uppercase;
-        letter-spacing: 1px;
-        margin-bottom: 1rem;
-        position: relative;
-    }
-    
-    .hero-tagline::before {
-        content: '';
-        position: absolute;
-        left: -3rem;
-        top: 50%;
-        width: 2rem;
-        height: 2px;
-        background: var(--accent-orange);
-        transform: translateY(-50%);
-    }
-    
-    .hero-title {
-        font-size: 3.5rem;
-        font-weight: 800;
-        color: var(--text-dark);
-        line-height: 1.1;
-        margin-bottom: 1.5rem;
-    }
-    
-    .hero-subtitle {
-        font-size: 1.2rem;
-        color: var(--text-gray);
-        line-height: 1.6;
-        margin-bottom: 2rem;
-    }
-    
-    .hero-features {
-        list-style: none;
-        margin-bottom: 2rem;
-    }
-    
-    .hero-features li {
-        color: var(--text-gray);
-        margin-bottom: 0.5rem;
-        position: relative;
-        padding-left: 1.5rem;
-    }
-    
-    .hero-features li::before {
-        content: '✓';
-        position: absolute;
-        left: 0;
-        color: var(--primary-teal);
-        font-weight: bold;
-    }
-    
-    .hero-actions {
-        display: flex;
-        gap: 1rem;
-        align-items: center;
-    }
-    
-    .primary-cta {
-        background: linear-gradient(135deg, var(--primary-teal) 0%, var(--primary-blue) 100%);
-        color: white;
-        padding: 1rem 2rem;
-        border-radius: 30px;
-        text-decoration: none;
-        font-weight: 600;
-        font-size: 1.1rem;
-        transition: transform 0.3s ease, box-shadow 0.3s ease;
-        border: none;
-        cursor: pointer;
-        display: flex;
-        align-items: center;
-        gap: 0.5rem;
-    }
-    
-    .primary-cta:hover {
-        transform: translateY(-3px);
-        box-shadow: 0 10px 30px rgba(5, 147, 162, 0.4);
-    }
-    
-    .social-links {
-        display: flex;
-        gap: 1rem;
-    }
-    
-    .social-link {
-        width: 40px;
-        height: 40px;
-        border-radius: 50%;
-        background: var(--white);
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        text-decoration: none;
-        color: var(--primary-teal);
-        box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-        transition: transform 0.3s ease;
-    }
-    
-    .social-link:hover {
-        transform: translateY(-2px);
-    }
-    
-    /* Hero Visual */
-    .hero-visual {
-        position: relative;
-        display: flex;
-        justify-content: center;
-        align-items: center;
-        height: 500px;
-    }
-    
-    /* Main AI Dashboard Mockup */
-    .ai-dashboard {
-        background: var(--white);
-        border-radius: 20px;
-        box-shadow: 0 25px 80px rgba(0,0,0,0.15);
-        width: 400px;
-        height: 300px;
-        transform: rotate(-8deg);
-        transition: transform 0.3s ease;
-        position: relative;
-        z-index: 10;
-    }
-    
-    .ai-dashboard:hover {
-        transform: rotate(-3deg) scale(1.02);
-    }
-    
-    .dashboard-header {
-        background: linear-gradient(135deg, var(--primary-teal) 0%, var(--primary-blue) 100%);
-        height: 50px;
-        border-radius: 20px 20px 0 0;
-        display: flex;
-        align-items: center;
-        justify-content: space-between;
-        padding: 0 1rem;
-        color: white;
-    }
-    
-    .dashboard-title {
-        font-weight: 600;
-        font-size: 0.9rem;
-    }
-    
-    .ai-status {
-        background: rgba(255,255,255,0.2);
-        padding: 0.3rem 0.8rem;
-        border-radius: 15px;
-        font-size: 0.8rem;
-        display: flex;
-        align-items: center;
-        gap: 0.3rem;
-    }
-    
-    .status-dot {
-        width: 8px;
-        height: 8px;
-        background: #00ff88;
-        border-radius: 50%;
-        animation: pulse 2s infinite;
-    }
-    
-    @keyframes pulse {
-        0%, 100% { opacity: 1; }
-        50% { opacity: 0.5; }
-    }
-    
-    .dashboard-content {
-        padding: 1rem;
-        height: 250px;
-        display: flex;
-        flex-direction: column;
-        gap: 0.8rem;
-    }
-    
-    .ai-metric {
-        background: var(--bg-light);
-        padding: 0.8rem;
-        border-radius: 10px;
-        display: flex;
-        justify-content: space-between;
-        align-items: center;
-        font-size: 0.85rem;
-    }
-    
-    .metric-value {
-        font-weight: 600;
-        color: var(--primary-teal);
-    }
-    
-    /* Floating AI Action Cards */
-    .ai-action-card {
-        position: absolute;
-        background: var(--white);
-        border-radius: 15px;
-        padding: 1rem;
-        box-shadow: 0 15px 40px rgba(0,0,0,0.1);
-        border-left: 4px solid var(--primary-teal);
-        min-width: 200px;
-        animation: float 4s ease-in-out infinite;
-    }
-    
-    .ai-action-card.card-1 {
-        top: 50px;
-        right: -50px;
-        animation-delay: 0s;
-        transform: rotate(5deg);
-    }
-    
-    .ai-action-card.card-2 {
-        bottom: 80px;
-        left: -80px;
-        animation-delay: 2s;
-        transform: rotate(-3deg);
-    }
-    
-    .ai-action-card.card-3 {
-        top: 20px;
-        left: -20px;
-        animation-delay: 1s;
-        transform: rotate(8deg);
-    }
-    
-    .card-header {
-        display: flex;
-        align-items: center;
-        gap: 0.5rem;
-        margin-bottom: 0.5rem;
-    }
-    
-    .card-icon {
-        width: 30px;
-        height: 30px;
-        border-radius: 8px;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        font-size: 0.9rem;
-    }
-    
-    .card-title {
-        font-weight: 600;
-        font-size: 0.9rem;
-        color: var(--text-dark);
-    }
-    
-    .card-content {
-        font-size: 0.8rem;
-        color: var(--text-gray);
-        line-height: 1.4;
-    }
-    
-    .card-progress {
-        margin-top: 0.5rem;
-        height: 4px;
-        background: var(--bg-light);
-        border-radius: 2px;
-        overflow: hidden;
-    }
-    
-    .progress-bar {
-        height: 100%;
-        background: linear-gradient(90deg, var(--primary-teal), var(--primary-blue));
-        border-radius: 2px;
-        animation: progress 3s ease-in-out infinite;
-    }
-    
-    @keyframes progress {
-        0% { width: 0%; }
-        50% { width: 100%; }
-        100% { width: 100%; }
-    }
-    
-    /* User Avatar */
-    .user-avatar {
-        position: absolute;
-        bottom: 150px;
-        right: 50px;
-        width: 60px;
-        height: 60px;
-        border-radius: 50%;
-        background: linear-gradient(135deg, #ff6b6b, #ffa500);
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        color: white;
-        font-weight: 600;
-        font-size: 1.2rem;
-        box-shadow: 0 10px 30px rgba(0,0,0,0.2);
-        animation: float 3s ease-in-out infinite;
-        animation-delay: 0.5s;
-    }
-    
-    /* Notification Badges */
-    .notification-badge {
-        position: absolute;
-        background: var(--accent-orange);
-        color: white;
-        padding: 0.3rem 0.8rem;
-        border-radius: 20px;
-        font-size: 0.75rem;
-        font-weight: 600;
-        box-shadow: 0 5px 15px rgba(255, 122, 72, 0.4);
-        animation: bounce 2s ease-in-out infinite;
-    }
-    
-    .notification-badge.badge-1 {
-        top: 100px;
-        right: 20px;
-        animation-delay: 0s;
-    }
-    
-    .notification-badge.badge-2 {
-        bottom: 200px;
-        left: 20px;
-        animation-delay: 1s;
-    }
-    
-    @keyframes bounce {
-        0%, 100% { transform: translateY(0px); }
-        50% { transform: translateY(-10px); }
-    }
-    
-    @keyframes float {
-        0%, 100% { transform: translateY(0px) rotate(var(--rotation, 0deg)); }
-        50% { transform: translateY(-15px) rotate(var(--rotation, 0deg)); }
-    }
-    
-    /* Features Section */
-    .features-section {
-        padding: 4rem 2rem;
-        background: var(--white);
-    }
-    
-    .features-container {
-        max-width: 1200px;
-        margin: 0 auto;
-        text-align: center;
-    }
-    
-    .section-title {
-        font-size: 2.5rem;
-        font-weight: 700;
-        color: var(--text-dark);
-        margin-bottom: 1rem;
-    }
-    
-    .section-subtitle {
-        font-size: 1.2rem;
-        color: var(--text-gray);
-        margin-bottom: 3rem;
-        max-width: 600px;
-        margin-left: auto;
-        margin-right: auto;
-    }
-    
-    .features-grid {
-        display: grid;
-        grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
-        gap: 2rem;
-        margin-top: 3rem;
-    }
-    
-    .feature-card {
-        background: var(--white);
-        padding: 2rem;
-        border-radius: 20px;
-        box-shadow: 0 10px 30px rgba(0,0,0,0.1);
-        transition: transform 0.3s ease, box-shadow 0.3s ease;
-        text-align: left;
-    }
-    
-    .feature-card:hover {
-        transform: translateY(-10px);
-        box-shadow: 0 20px 50px rgba(0,0,0,0.15);
-    }
-    
-    .feature-icon {
-        width: 60px;
-        height: 60px;
-        background: linear-gradient(135deg, var(--primary-teal) 0%, var(--primary-blue) 100%);
-        border-radius: 15px;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        font-size: 1.5rem;
-        color: white;
-        margin-bottom: 1.5rem;
-    }
-    
-    .feature-title {
-        font-size: 1.3rem;
-        font-weight: 600;
-        color: var(--text-dark);
-        margin-bottom: 1rem;
-    }
-    
-    .feature-description {
-        color: var(--text-gray);
-        line-height: 1.6;
-    }
-    
-    /* Stats Section */
-    .stats-section {
-        background: linear-gradient(135deg, var(--primary-blue) 0%, var(--primary-teal) 100%);
-        padding: 4rem 2rem;
-        color: white;
-    }
-    
-    .stats-container {
-        max-width: 1200px;
-        margin: 0 auto;
-        display: grid;
-        grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-        gap: 2rem;
-        text-align: center;
-    }
-    
-    .stat-item {
-        padding: 1rem;
-    }
-    
-    .stat-number {
-        font-size: 3rem;
-        font-weight: 800;
-        margin-bottom: 0.5rem;
-        color: var(--accent-yellow);
-    }
-    
-    .stat-label {
-        font-size: 1.1rem;
-        opacity: 0.9;
-    }
-    
-    /* CTA Section */
-    .cta-section {
-        background: var(--bg-light);
-        padding: 4rem 2rem;
-        text-align: center;
-    }
-    
-    .cta-container {
-        max-width: 800px;
-        margin: 0 auto;
-    }
-    
-    .cta-title {
-        font-size: 2.5rem;
-        font-weight: 700;
-        color: var(--text-dark);
-        margin-bottom: 1rem;
-    }
-    
-    .cta-description {
-        font-size: 1.2rem;
-        color: var(--text-gray);
-        margin-bottom: 2rem;
-    }
-    
-    /* Hide Streamlit elements */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    header {visibility: hidden;}
-    .stDeployButton {visibility: hidden;}
-    
-    /* Responsive Design */
-    @media (max-width: 768px) {
-        .hero-container {
-            grid-template-columns: 1fr;
-            text-align: center;
-        }
-        
-        .hero-title {
-            font-size: 2.5rem;
-        }
-        
-        .nav-menu {
-            display: none;
-        }
-    }
-</style>
-""", unsafe_allow_html=True)
+# Custom CSS for professional landing page, kept out of the module source
+_LANDING_CSS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'styles', 'landing.css')
+
+_CSS_COMMENT_RE = re.compile(r'/\*.*?\*/', re.DOTALL)
+_CSS_WHITESPACE_RE = re.compile(r'\s+')
+_CSS_PUNCTUATION_RE = re.compile(r'\s*([{};,])\s*')
+
+def _minify_css(css):
+    """Strip comments and redundant whitespace from a stylesheet"""
+    css = _CSS_COMMENT_RE.sub('', css)
+    css = _CSS_WHITESPACE_RE.sub(' ', css)
+    return _CSS_PUNCTUATION_RE.sub(r'\1', css).strip()
+
+# Bump when styles/landing.css changes so the browser sees a new <style> id
+_LANDING_CSS_VERSION = 'v8'
+
+# Streamlit re-executes this module on every rerun, so a plain lru_cache
+# would start empty each time; cache_resource outlives the rerun
+@st.cache_resource
+def _css(version):
+    """Read, minify and wrap the landing stylesheet, shared by every session"""
+    with open(_LANDING_CSS_PATH, encoding='utf-8') as css_file:
+        css = _minify_css(css_file.read())
+    return f'<style id="landing-css-{version}">{css}</style>'
+
+def _inject_css():
+    """Inject the landing page stylesheet"""
+    # Streamlit drops elements that a rerun does not emit, so this still runs
+    # on every rerun; only the file read and minification are cached
+    st.markdown(_css(_LANDING_CSS_VERSION), unsafe_allow_html=True)
+
+_inject_css()
+
+def _metrics_row(metrics):
+    """HTML for a row of (label, value, delta) metric cards, emitted as one markdown element"""
+    cards = ''.join(
+        f'<div class="ai-metric"><span>{label}</span><span class="metric-value">{value}</span>'
+        f'<span class="metric-delta">{delta}</span></div>'
+        for label, value, delta in metrics
+    )
+    return f'<div class="metrics-row">{cards}</div>'
+
+def _alert_list(items):
+    """HTML for consecutive (kind, body) alerts styled like st.info/st.success/st.warning"""
+    return ''.join(f'<div class="alert alert-{kind}">{body}</div>' for kind, body in items)
+
+# Static onboarding chrome
+_WELCOME_BANNER_HTML = """
+<div style="background: linear-gradient(135deg, #0593A2 0%, #103778 100%); padding: 2rem; border-radius: 15px; margin: 2rem 0; color: white; text-align: center;">
+    <h1>🎉 Welcome to AI Career Agent!</h1>
+    <p style="font-size: 1.2rem; margin-bottom: 2rem;">Your AI-powered career journey starts now</p>
+</div>
+"""
+
+_AI_WORKING_CARDS_HTML = """
+<div style="display: flex; gap: 1rem; margin: 1rem 0;">
+    <div class="ai-metric" style="flex: 1; flex-direction: column; align-items: flex-start; gap: 0.3rem;">
+        <strong>🔍 Scanning Job Boards</strong>
+        <span>Searching 50+ platforms for matches...</span>
+    </div>
+    <div class="ai-metric" style="flex: 1; flex-direction: column; align-items: flex-start; gap: 0.3rem;">
+        <strong>📝 Optimizing Resume</strong>
+        <span>Tailoring your resume for top matches...</span>
+    </div>
+    <div class="ai-metric" style="flex: 1; flex-direction: column; align-items: flex-start; gap: 0.3rem;">
+        <strong>📊 Market Analysis</strong>
+        <span>Analyzing salary trends and requirements...</span>
+    </div>
+</div>
+"""
+
+_INITIAL_RESULTS_HTML = _metrics_row((
+    ('Jobs Found', '47', '+47'),
+    ('Perfect Matches', '12', '+12'),
+    ('Resume Score', '85/100', '+15'),
+    ('Avg Salary', '$125K', 'Market Rate')
+))
+
+_NEXT_STEPS_MD = """
+**Your AI Career Agent will now:**
+- 🔄 **Monitor job boards 24/7** and find new opportunities daily
+- 📧 **Send you daily updates** with new job matches and applications sent
+- 📞 **Schedule interviews** automatically when you get responses
+- 📈 **Track your progress** and optimize your job search strategy
+- 🎯 **Provide career guidance** based on market trends and your goals
+"""
 
 def render_onboarding_flow():
     """Show what happens after clicking START FREE TRIAL"""
-    st.markdown("""
-    <div style="background: linear-gradient(135deg, #0593A2 0%, #103778 100%); padding: 2rem; border-radius: 15px; margin: 2rem 0; color: white; text-align: center;">
-        <h1>🎉 Welcome to AI Career Agent!</h1>
-        <p style="font-size: 1.2rem; margin-bottom: 2rem;">Your AI-powered career journey starts now</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_WELCOME_BANNER_HTML, unsafe_allow_html=True)
     
     # Onboarding steps
     st.markdown("## 🚀 Let's Get You Started")
@@ -671,7 +147,7 @@ def render_onboarding_flow():
         
         if submitted and name and email and dream_job:
             # Store user data temporarily
-            st.session_state.temp_profile = {
+            profile = {
                 'name': name,
                 'email': email,
                 'status': status,
@@ -682,7 +158,7 @@ def render_onboarding_flow():
                 'auto_apply': auto_apply,
                 'resume_optimization': resume_optimization
             }
-            st.session_state.onboarding_completed = True
+            st.session_state.update({'temp_profile': profile, 'onboarding_completed': True})
             
             # Show success and AI activation
             st.balloons()
@@ -691,67 +167,36 @@ def render_onboarding_flow():
             # Show what the AI will do
             st.markdown("## 🤖 Your AI Agent is Now Working...")
             
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.info("🔍 **Scanning Job Boards**\nSearching 50+ platforms for matches...")
-            with col2:
-                st.info("📝 **Optimizing Resume**\nTailoring your resume for top matches...")
-            with col3:
-                st.info("📊 **Market Analysis**\nAnalyzing salary trends and requirements...")
-            
-            # Simulate AI progress
-            progress_bar = st.progress(0)
-            status_text = st.empty()
+            st.markdown(_AI_WORKING_CARDS_HTML, unsafe_allow_html=True)
             
-            import time
-            for i in range(100):
-                progress_bar.progress(i + 1)
-                if i < 30:
-                    status_text.text("🔍 Scanning job boards...")
-                elif i < 60:
-                    status_text.text("📝 Optimizing your resume...")
-                elif i < 90:
-                    status_text.text("📊 Analyzing market data...")
-                else:
-                    status_text.text("✅ Setup complete!")
-                time.sleep(0.05)
+            # Simulate AI progress with a CSS animation so the script never sleeps
+            st.markdown("""
+            <div class="card-progress"><div class="progress-bar progress-once"></div></div>
+            """, unsafe_allow_html=True)
+            st.text("✅ Setup complete!")
             
             # Show results
             st.markdown("## 🎯 Initial Results")
             
-            col1, col2, col3, col4 = st.columns(4)
-            with col1:
-                st.metric("Jobs Found", "47", "+47")
-            with col2:
-                st.metric("Perfect Matches", "12", "+12")
-            with col3:
-                st.metric("Resume Score", "85/100", "+15")
-            with col4:
-                st.metric("Avg Salary", "$125K", "Market Rate")
+            st.markdown(_INITIAL_RESULTS_HTML, unsafe_allow_html=True)
             
             # Next steps
             st.markdown("## 🚀 What Happens Next?")
             
-            st.info("""
-            **Your AI Career Agent will now:**
-            - 🔄 **Monitor job boards 24/7** and find new opportunities daily
-            - 📧 **Send you daily updates** with new job matches and applications sent
-            - 📞 **Schedule interviews** automatically when you get responses
-            - 📈 **Track your progress** and optimize your job search strategy
-            - 🎯 **Provide career guidance** based on market trends and your goals
-            """)
+            st.info(_NEXT_STEPS_MD)
             
         elif submitted:
             st.error("Please fill in all required fields (Name, Email, Dream Job)")
     
     # CTA to main app - Outside the form
-    if st.session_state.get('onboarding_completed', False):
+    if st.session_state.onboarding_completed:
         if st.button("🎯 GO TO MY AI CAREER DASHBOARD", use_container_width=True, type="primary"):
             # Store user data and redirect to main app
-            profile_data = st.session_state.get('temp_profile', {})
-            st.session_state.user_profile = profile_data
-            st.session_state.show_main_app = True
-            st.session_state.show_onboarding = False
+            st.session_state.update({
+                'user_profile': st.session_state.get('temp_profile', {}),
+                'show_main_app': True,
+                'show_onboarding': False
+            })
             st.rerun()
     
     # Back to landing page
@@ -759,65 +204,51 @@ def render_onboarding_flow():
         st.session_state.show_onboarding = False
         st.rerun()
 
-def render_navigation():
-    """Render the navigation header with functional buttons"""
-    # Header Navigation
-    st.markdown("""
-    <div class="header-nav">
-        <div class="nav-container">
-            <div class="logo">
-                🎓 AI Career Agent
-            </div>
+# Landing navigation: page key (also the ?nav= value) -> label
+_NAV_LINKS = {
+    'home': '🏠 Home',
+    'features': '⚡ Features',
+    'how_it_works': '🔄 How It Works',
+    'success_stories': '🏆 Success Stories',
+    'pricing': '💰 Pricing',
+    'about': '👥 About Us'
+}
+
+_NAV_HTML = """
+<div class="header-nav">
+    <div class="nav-container">
+        <div class="logo">
+            🎓 AI Career Agent
         </div>
     </div>
-    """, unsafe_allow_html=True)
+</div>
+"""
+
+def _sync_nav_query_param():
+    """Mirror the selected landing page into ?nav= so the URL stays shareable"""
+    st.query_params['nav'] = st.session_state.current_nav_page
+
+def render_navigation():
+    """Render the navigation header and the free trial button"""
+    # Header Navigation
+    st.markdown(_NAV_HTML, unsafe_allow_html=True)
     
-    # Functional navigation buttons in same positions
-    col1, col2, col3, col4, col5, col6, col7, col8 = st.columns([1, 1, 1, 1, 1, 1, 0.5, 1.5])
+    # One radio widget bound to current_nav_page instead of six buttons; it
+    # reruns in place, so session state survives a page switch
+    col1, col2 = st.columns([6.5, 1.5])
     
     with col1:
-        if st.button("🏠 Home", use_container_width=True, key="nav_home_1"):
-            st.session_state.current_nav_page = 'home'
-            st.rerun()
+        st.radio("Navigation", list(_NAV_LINKS), key="current_nav_page", horizontal=True,
+                 format_func=_NAV_LINKS.get, label_visibility="collapsed",
+                 on_change=_sync_nav_query_param)
     
     with col2:
-        if st.button("⚡ Features", use_container_width=True):
-            st.session_state.current_nav_page = 'features'
-            st.rerun()
-    
-    with col3:
-        if st.button("🔄 How It Works", use_container_width=True):
-            st.session_state.current_nav_page = 'how_it_works'
-            st.rerun()
-    
-    with col4:
-        if st.button("🏆 Success Stories", use_container_width=True):
-            st.session_state.current_nav_page = 'success_stories'
-            st.rerun()
-    
-    with col5:
-        if st.button("💰 Pricing", use_container_width=True):
-            st.session_state.current_nav_page = 'pricing'
-            st.rerun()
-    
-    with col6:
-        if st.button("👥 About Us", use_container_width=True):
-            st.session_state.current_nav_page = 'about'
-            st.rerun()
-    
-    with col7:
-        st.write("")  # Spacer
-    
-    with col8:
         if st.button("🚀 START FREE TRIAL", type="primary", use_container_width=True):
             st.session_state.show_onboarding = True
             st.rerun()
 
-def render_home_page():
-    """Render the main landing page content"""
-    
-    # Hero Section - Complete layout in one markdown block
-    st.markdown("""
+# Static landing sections shared by render_home_page and render_landing_page
+_HERO_HTML = """
     <div class="hero-section">
         <div class="hero-container">
             <div class="hero-content">
@@ -833,15 +264,6 @@ def render_home_page():
                     <li>Smart interview scheduling and preparation</li>
                     <li>Real-time market intelligence and salary insights</li>
                 </ul>
-                <div class="hero-actions">
-                    <button class="primary-cta">🚀 START YOUR CAREER JOURNEY</button>
-                    <div class="social-links">
-                        <a href="#" class="social-link">📧</a>
-                        <a href="#" class="social-link">💼</a>
-                        <a href="#" class="social-link">🐦</a>
-                        <a href="#" class="social-link">📱</a>
-                    </div>
-                </div>
             </div>
             <div class="hero-visual">
                 <div class="ai-dashboard">
@@ -874,38 +296,27 @@ def render_home_page():
             </div>
         </div>
     </div>
-    """, unsafe_allow_html=True)
-    
-    # Interactive CTA Buttons
-    # Professional call-to-action section
-    col1, col2, col3 = st.columns([1, 2, 1])
-    with col2:
-        st.markdown("### 🚀 Ready to Transform Your Career?")
-        
-        # Main CTA button
-        if st.button("🚀 START FREE TRIAL", use_container_width=True, type="primary"):
-            st.session_state.show_onboarding = True
-            st.success("✅ Button clicked! Loading onboarding...")
-            st.rerun()
-    
-    # Debug info
-    st.write(f"Debug: show_onboarding = {st.session_state.get('show_onboarding', False)}")
-    
-    # Show onboarding flow when button is clicked
-    if st.session_state.get('show_onboarding', False):
-        st.markdown("---")
-        st.markdown("## 🎯 ONBOARDING FLOW ACTIVATED")
-        render_onboarding_flow()
-    
-    # Features Section
-    st.markdown("""
-    <div class="features-section">
-        <div class="features-container">
-            <h2 class="section-title">Why Choose AI Career Agent?</h2>
+    """
+
+# Features heading shared by the landing and home page sections
+_FEATURES_HEADER_HTML = """            <h2 class="section-title">Why Choose AI Career Agent?</h2>
             <p class="section-subtitle">
                 We combine cutting-edge AI with deep career expertise to give you an unfair advantage in today's competitive job market.
             </p>
-            <div class="features-grid">
+"""
+
+def _features_section(body):
+    """Wrap features markup in the shared section container and heading"""
+    return f"""
+    <div class="features-section">
+        <div class="features-container">
+{_FEATURES_HEADER_HTML}{body}        </div>
+    </div>
+    """
+
+_FEATURES_HTML = _features_section('')
+
+_FEATURES_GRID_HTML = _features_section("""            <div class="features-grid">
                 <div class="feature-card">
                     <div class="feature-icon">🤖</div>
                     <h3 class="feature-title">AI-Powered Automation</h3>
@@ -949,12 +360,9 @@ def render_home_page():
                     </p>
                 </div>
             </div>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Stats Section
-    st.markdown("""
+""")
+
+_STATS_HTML = """
     <div class="stats-section">
         <div class="stats-container">
             <div class="stat-item">
@@ -975,10 +383,9 @@ def render_home_page():
             </div>
         </div>
     </div>
-    """, unsafe_allow_html=True)
-    
-    # Final CTA Section
-    st.markdown("""
+    """
+
+_CTA_HTML = """
     <div class="cta-section">
         <div class="cta-container">
             <h2 class="cta-title">Ready to Land Your Dream Job?</h2>
@@ -988,123 +395,152 @@ def render_home_page():
             </p>
         </div>
     </div>
-    """, unsafe_allow_html=True)
-    
-    # Final CTA Button
+    """
+
+# Home page hero, features grid and stats, sent as one markdown element per rerun
+_HOME_HTML = _HERO_HTML + _FEATURES_GRID_HTML + _STATS_HTML
+
+def _render_final_cta():
+    """Closing call-to-action button shared by the landing layouts"""
     col1, col2, col3 = st.columns([1, 2, 1])
     with col2:
         if st.button("🎓 START YOUR SUCCESS STORY", use_container_width=True, type="primary"):
             st.session_state.show_onboarding = True
             st.rerun()
 
+def render_home_page():
+    """Render the main landing page content"""
+    
+    # Hero, features and stats sections in a single static block
+    st.markdown(_HOME_HTML, unsafe_allow_html=True)
+    
+    # The free trial button lives in the navigation bar rendered above
+    
+    # Debug info
+    if os.environ.get("LANDING_DEBUG"):
+        st.write(f"Debug: show_onboarding = {st.session_state.show_onboarding}")
+    
+    # Show onboarding flow when button is clicked
+    if st.session_state.show_onboarding:
+        st.markdown("---")
+        st.markdown("## 🎯 ONBOARDING FLOW ACTIVATED")
+        render_onboarding_flow()
+    
+    # Final CTA Section
+    st.markdown(_CTA_HTML, unsafe_allow_html=True)
+    _render_final_cta()
+
 # Import main app functions
+@st.cache_data(ttl=3600)
 def create_sample_data():
     """Generate sample career data for visualization"""
+    import numpy as np
+    import pandas as pd
+    
+    # Counts and salaries fit comfortably in int32/int16; labels are low-cardinality categoricals
     # Job market trends data
     job_trends = pd.DataFrame({
-        'Month': pd.date_range('2024-01-01', periods=12, freq='ME'),
-        'Software Engineer': [850, 920, 1100, 1250, 1180, 1300, 1450, 1380, 1520, 1600, 1750, 1800],
-        'Data Scientist': [420, 480, 550, 620, 580, 650, 720, 680, 750, 800, 850, 900],
-        'Product Manager': [320, 350, 400, 450, 430, 480, 520, 500, 550, 580, 620, 650],
-        'DevOps Engineer': [280, 320, 380, 420, 400, 450, 490, 470, 520, 550, 580, 600]
+        'Month': np.array(['2024-01-31', '2024-02-29', '2024-03-31', '2024-04-30', '2024-05-31', '2024-06-30',
+                           '2024-07-31', '2024-08-31', '2024-09-30', '2024-10-31', '2024-11-30', '2024-12-31'],
+                          dtype='datetime64[ns]'),
+        'Software Engineer': np.array([850, 920, 1100, 1250, 1180, 1300, 1450, 1380, 1520, 1600, 1750, 1800], dtype=np.int32),
+        'Data Scientist': np.array([420, 480, 550, 620, 580, 650, 720, 680, 750, 800, 850, 900], dtype=np.int32),
+        'Product Manager': np.array([320, 350, 400, 450, 430, 480, 520, 500, 550, 580, 620, 650], dtype=np.int32),
+        'DevOps Engineer': np.array([280, 320, 380, 420, 400, 450, 490, 470, 520, 550, 580, 600], dtype=np.int32)
     })
     
     # Salary ranges by experience
     salary_data = pd.DataFrame({
-        'Experience': ['0-2 years', '3-5 years', '6-10 years', '10+ years'],
-        'Software Engineer': [75000, 105000, 140000, 180000],
-        'Data Scientist': [80000, 110000, 145000, 185000],
-        'Product Manager': [85000, 120000, 160000, 200000],
-        'DevOps Engineer': [70000, 100000, 135000, 175000]
+        'Experience': pd.Categorical(['0-2 years', '3-5 years', '6-10 years', '10+ years']),
+        'Software Engineer': np.array([75000, 105000, 140000, 180000], dtype=np.int32),
+        'Data Scientist': np.array([80000, 110000, 145000, 185000], dtype=np.int32),
+        'Product Manager': np.array([85000, 120000, 160000, 200000], dtype=np.int32),
+        'DevOps Engineer': np.array([70000, 100000, 135000, 175000], dtype=np.int32)
     })
     
     # Skills demand data
     skills_data = pd.DataFrame({
-        'Skill': ['Python', 'JavaScript', 'AWS', 'React', 'SQL', 'Docker', 'Kubernetes', 'Machine Learning'],
-        'Demand_Score': [95, 88, 92, 78, 85, 82, 75, 90],
-        'Growth_Rate': [15, 12, 25, 18, 8, 20, 28, 35]
+        'Skill': pd.Categorical(['Python', 'JavaScript', 'AWS', 'React', 'SQL', 'Docker', 'Kubernetes', 'Machine Learning']),
+        'Demand_Score': np.array([95, 88, 92, 78, 85, 82, 75, 90], dtype=np.int32),
+        'Growth_Rate': np.array([15, 12, 25, 18, 8, 20, 28, 35], dtype=np.int16)
     })
     
     # Geographic job distribution
     geo_data = pd.DataFrame({
-        'City': ['San Francisco', 'New York', 'Seattle', 'Austin', 'Boston', 'Chicago', 'Los Angeles', 'Denver'],
-        'Job_Count': [2500, 2200, 1800, 1200, 1100, 900, 1400, 800],
-        'Avg_Salary': [165000, 145000, 155000, 125000, 140000, 120000, 135000, 115000],
-        'Cost_of_Living_Index': [100, 85, 75, 60, 70, 55, 80, 58]
+        'City': pd.Categorical(['San Francisco', 'New York', 'Seattle', 'Austin', 'Boston', 'Chicago', 'Los Angeles', 'Denver']),
+        'Job_Count': np.array([2500, 2200, 1800, 1200, 1100, 900, 1400, 800], dtype=np.int32),
+        'Avg_Salary': np.array([165000, 145000, 155000, 125000, 140000, 120000, 135000, 115000], dtype=np.int32),
+        'Cost_of_Living_Index': np.array([100, 85, 75, 60, 70, 55, 80, 58], dtype=np.int16)
     })
     
     return job_trends, salary_data, skills_data, geo_data
 
+# Roles plotted on the analytics dashboard, one trace each
+_CHART_ROLES = ('Software Engineer', 'Data Scientist', 'Product Manager', 'DevOps Engineer')
+
+_MAIN_HEADER_HTML = """
+<div style="background: linear-gradient(135deg, #0593A2 0%, #103778 100%); padding: 1rem 2rem; margin: -1rem -1rem 2rem -1rem; color: white; box-shadow: 0 4px 20px rgba(21, 31, 48, 0.3);">
+    <div style="display: flex; justify-content: space-between; align-items: center; max-width: 1200px; margin: 0 auto;">
+        <div style="display: flex; align-items: center; gap: 1rem;">
+            <span style="font-size: 2rem;">🎓</span>
+            <h1 style="margin: 0; font-size: 1.8rem;">AI Career Agent Dashboard</h1>
+        </div>
+        <div style="display: flex; gap: 1rem; align-items: center;">
+            <span style="color: rgba(255,255,255,0.8);">📧 Gmail Notifications: ON</span>
+        </div>
+    </div>
+</div>
+"""
+
+# Main-app pages rerun on their own when their widgets change (st.fragment, Streamlit 1.37+,
+# st.experimental_fragment on 1.33-1.36); older versions fall back to full-script reruns
+_fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', lambda func: func)
+
+# Main app navigation: page key -> label
+_MAIN_NAV_LABELS = {
+    'Home': '🏠 Home',
+    'Dashboard': '📊 Dashboard',
+    'Jobs': '💼 Jobs',
+    'Career Plan': '🎯 Career Plan',
+    'Resume': '📝 Resume',
+    'Notifications': '📧 Notifications'
+}
+
 def render_main_app():
     """Render the main AI Career Agent application"""
     # Header for main app
-    st.markdown("""
-    <div style="background: linear-gradient(135deg, #0593A2 0%, #103778 100%); padding: 1rem 2rem; margin: -1rem -1rem 2rem -1rem; color: white; box-shadow: 0 4px 20px rgba(21, 31, 48, 0.3);">
-        <div style="display: flex; justify-content: space-between; align-items: center; max-width: 1200px; margin: 0 auto;">
-            <div style="display: flex; align-items: center; gap: 1rem;">
-                <span style="font-size: 2rem;">🎓</span>
-                <h1 style="margin: 0; font-size: 1.8rem;">AI Career Agent Dashboard</h1>
-            </div>
-            <div style="display: flex; gap: 1rem; align-items: center;">
-                <span style="color: rgba(255,255,255,0.8);">📧 Gmail Notifications: ON</span>
-            </div>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_MAIN_HEADER_HTML, unsafe_allow_html=True)
     
-    # Navigation buttons
-    col1, col2, col3, col4, col5, col6, col7 = st.columns(7)
+    # Navigation: one radio widget bound to current_page instead of six buttons
+    col1, col2 = st.columns([6, 1])
     
     with col1:
-        if st.button("🏠 Home", use_container_width=True, key="nav_home_2"):
-            st.session_state.current_page = 'Home'
+        st.radio("Navigation", list(_MAIN_NAV_LABELS), key="current_page", horizontal=True,
+                 format_func=_MAIN_NAV_LABELS.get, label_visibility="collapsed")
     
     with col2:
-        if st.button("📊 Dashboard", use_container_width=True, key="nav_dashboard_landing"):
-            st.session_state.current_page = 'Dashboard'
-    
-    with col3:
-        if st.button("💼 Jobs", use_container_width=True, key="nav_jobs_landing"):
-            st.session_state.current_page = 'Jobs'
-    
-    with col4:
-        if st.button("🎯 Career Plan", use_container_width=True, key="nav_career_landing"):
-            st.session_state.current_page = 'Career Plan'
-    
-    with col5:
-        if st.button("📝 Resume", use_container_width=True, key="nav_resume_landing"):
-            st.session_state.current_page = 'Resume'
-    
-    with col6:
-        if st.button("📧 Notifications", use_container_width=True, key="nav_notifications_landing"):
-            st.session_state.current_page = 'Notifications'
-    
-    with col7:
         if st.button("← Back to Landing", use_container_width=True):
-            st.session_state.show_main_app = False
-            st.session_state.show_onboarding = False
+            st.session_state.update({'show_main_app': False, 'show_onboarding': False})
             st.rerun()
     
-    # Initialize current page
-    if 'current_page' not in st.session_state:
-        st.session_state.current_page = 'Home'
-    
     # Render page content based on selection
-    page = st.session_state.current_page
-    
-    if page == 'Home':
-        render_home_dashboard()
-    elif page == 'Dashboard':
-        render_analytics_dashboard()
-    elif page == 'Jobs':
-        render_jobs_page()
-    elif page == 'Career Plan':
-        render_career_planning()
-    elif page == 'Resume':
-        render_resume_tools()
-    elif page == 'Notifications':
-        render_notifications_center()
+    _MAIN_PAGES.get(st.session_state.current_page, render_home_dashboard)()
+
+_HOME_METRICS_HTML = _metrics_row((
+    ("🎯 Jobs Found", "47", "+12 today"),
+    ("📝 Applications", "23", "+5 today"),
+    ("📞 Interviews", "8", "+2 this week"),
+    ("✅ Response Rate", "34%", "+8%")
+))
+
+_RECENT_ACTIVITY_MD = "### 🔄 Recent AI Activity\n\n" + _alert_list((
+    ('info', "🤖 <strong>2 hours ago:</strong> Applied to Senior Developer position at Google"),
+    ('info', "🎯 <strong>4 hours ago:</strong> Found 3 new job matches in your area"),
+    ('info', "📝 <strong>6 hours ago:</strong> Optimized resume for Meta application"),
+    ('success', "📞 <strong>Yesterday:</strong> Interview scheduled with Microsoft for tomorrow 2 PM")
+))
 
+@_fragment
 def render_home_dashboard():
     """Render personalized home dashboard"""
     profile = st.session_state.get('user_profile', {})
@@ -1113,60 +549,92 @@ def render_home_dashboard():
     st.markdown(f"**Dream Job:** {profile.get('dream_job', 'Not specified')}")
     
     # Key metrics
-    col1, col2, col3, col4 = st.columns(4)
-    with col1:
-        st.metric("🎯 Jobs Found", "47", "+12 today")
-    with col2:
-        st.metric("📝 Applications", "23", "+5 today")
-    with col3:
-        st.metric("📞 Interviews", "8", "+2 this week")
-    with col4:
-        st.metric("✅ Response Rate", "34%", "+8%")
+    st.markdown(_HOME_METRICS_HTML, unsafe_allow_html=True)
     
     # Recent activity
-    st.markdown("### 🔄 Recent AI Activity")
-    st.info("🤖 **2 hours ago:** Applied to Senior Developer position at Google")
-    st.info("🎯 **4 hours ago:** Found 3 new job matches in your area")
-    st.info("📝 **6 hours ago:** Optimized resume for Meta application")
-    st.success("📞 **Yesterday:** Interview scheduled with Microsoft for tomorrow 2 PM")
+    st.markdown(_RECENT_ACTIVITY_MD, unsafe_allow_html=True)
+
+@st.cache_resource
+def _get_trends_figure():
+    """Job market trends line chart, built once and shared by every session"""
+    import plotly.graph_objects as go
+    
+    job_trends = create_sample_data()[0]
+    fig = go.Figure()
+    months = job_trends['Month'].to_numpy()
+    for role in _CHART_ROLES:
+        fig.add_trace(go.Scatter(x=months, y=job_trends[role].to_numpy(), mode='lines', name=role))
+    fig.update_layout(title="Job Market Trends", xaxis_title='Month',
+                      yaxis_title='Job_Postings', legend_title_text='Role')
+    return fig
+
+@st.cache_resource
+def _get_salary_figure():
+    """Salary by experience bar chart, built once and shared by every session"""
+    import plotly.graph_objects as go
+    
+    salary_data = create_sample_data()[1]
+    fig = go.Figure()
+    experience = salary_data['Experience'].to_numpy()
+    for role in _CHART_ROLES:
+        fig.add_trace(go.Bar(x=experience, y=salary_data[role].to_numpy(), name=role))
+    fig.update_layout(title="Salary by Experience", xaxis_title='Experience',
+                      yaxis_title='Salary', legend_title_text='Role', barmode='relative')
+    return fig
 
+@_fragment
 def render_analytics_dashboard():
     """Render analytics dashboard"""
     st.markdown("## 📊 Career Analytics")
     
-    job_trends, salary_data, skills_data, geo_data = create_sample_data()
-    
-    # Charts
+    # Charts (shared figures; never mutate them here)
     col1, col2 = st.columns(2)
     
     with col1:
-        fig = px.line(job_trends.melt(id_vars=['Month'], var_name='Role', value_name='Job_Postings'),
-                     x='Month', y='Job_Postings', color='Role', title="Job Market Trends")
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_get_trends_figure(), use_container_width=True)
     
     with col2:
-        fig = px.bar(salary_data.melt(id_vars=['Experience'], var_name='Role', value_name='Salary'),
-                    x='Experience', y='Salary', color='Role', title="Salary by Experience")
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_get_salary_figure(), use_container_width=True)
+
+def _html_table(columns, rows):
+    """HTML table for a handful of display-only rows (no DataFrame needed)"""
+    head = ''.join(f'<th>{column}</th>' for column in columns)
+    body = ''.join('<tr>' + ''.join(f'<td>{cell}</td>' for cell in row) + '</tr>' for row in rows)
+    return f'<table><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table>'
 
+# Sample job listings shown on the Jobs page
+_JOBS_COLUMNS = ('Company', 'Position', 'Salary', 'Match', 'Status')
+_JOBS = (
+    ('Google', 'Software Engineer', '$150K-$200K', '95%', 'Applied ✅'),
+    ('Microsoft', 'Product Manager', '$140K-$180K', '88%', 'Ready 🚀'),
+    ('Amazon', 'Data Scientist', '$160K-$210K', '92%', 'Applied ✅'),
+    ('Meta', 'ML Engineer', '$170K-$220K', '90%', 'Interview 📞'),
+    ('Apple', 'iOS Developer', '$145K-$190K', '85%', 'Saved 💾')
+)
+_JOBS_TABLE_HTML = _html_table(_JOBS_COLUMNS, _JOBS)
+
+# Sample career roadmap shown on the Career Plan page
+_TIMELINE_COLUMNS = ('Stage', 'Role', 'Salary', 'Key Skills')
+_TIMELINE = (
+    ('Current', 'Student/Entry', '$0-60K', 'Basic Programming'),
+    ('6 Months', 'Junior Developer', '$80K-100K', 'Full Stack'),
+    ('1 Year', 'Software Engineer', '$120K-150K', 'System Design'),
+    ('2 Years', 'Senior Engineer', '$160K-200K', 'Leadership')
+)
+_TIMELINE_TABLE_HTML = _html_table(_TIMELINE_COLUMNS, _TIMELINE)
+
+@_fragment
 def render_jobs_page():
     """Render jobs page"""
     st.markdown("## 💼 Job Opportunities")
     
     # Job listings
-    jobs_data = pd.DataFrame({
-        'Company': ['Google', 'Microsoft', 'Amazon', 'Meta', 'Apple'],
-        'Position': ['Software Engineer', 'Product Manager', 'Data Scientist', 'ML Engineer', 'iOS Developer'],
-        'Salary': ['$150K-$200K', '$140K-$180K', '$160K-$210K', '$170K-$220K', '$145K-$190K'],
-        'Match': ['95%', '88%', '92%', '90%', '85%'],
-        'Status': ['Applied ✅', 'Ready 🚀', 'Applied ✅', 'Interview 📞', 'Saved 💾']
-    })
-    
-    st.dataframe(jobs_data, use_container_width=True)
+    st.markdown(_JOBS_TABLE_HTML, unsafe_allow_html=True)
     
     if st.button("🚀 Apply to All Matches", use_container_width=True):
         st.success("✅ AI is applying to 3 new positions! You'll get email confirmations.")
 
+@_fragment
 def render_career_planning():
     """Render career planning page"""
     st.markdown("## 🎯 Career Planning")
@@ -1175,15 +643,9 @@ def render_career_planning():
     
     st.markdown(f"### 📈 Career Roadmap for: {profile.get('dream_job', 'Your Career')}")
     
-    timeline_data = pd.DataFrame({
-        'Stage': ['Current', '6 Months', '1 Year', '2 Years'],
-        'Role': ['Student/Entry', 'Junior Developer', 'Software Engineer', 'Senior Engineer'],
-        'Salary': ['$0-60K', '$80K-100K', '$120K-150K', '$160K-200K'],
-        'Key Skills': ['Basic Programming', 'Full Stack', 'System Design', 'Leadership']
-    })
-    
-    st.dataframe(timeline_data, use_container_width=True)
+    st.markdown(_TIMELINE_TABLE_HTML, unsafe_allow_html=True)
 
+@_fragment
 def render_resume_tools():
     """Render resume tools page"""
     st.markdown("## 📝 Resume Optimization")
@@ -1200,14 +662,18 @@ def render_resume_tools():
             if st.button("🤖 Optimize with AI"):
                 st.success("✅ Resume optimized and saved!")
 
+_RECENT_NOTIFICATIONS_MD = "### 📬 Recent Notifications\n\n" + _alert_list((
+    ('info', "🎯 <strong>2 hours ago:</strong> New job match found at Tesla"),
+    ('success', "📞 <strong>Yesterday:</strong> Interview confirmed with Google"),
+    ('warning', "⏰ <strong>Reminder:</strong> Microsoft interview tomorrow at 2 PM")
+))
+
+@_fragment
 def render_notifications_center():
     """Render notifications center"""
     st.markdown("## 📧 Notifications Center")
     
-    st.markdown("### 📬 Recent Notifications")
-    st.info("🎯 **2 hours ago:** New job match found at Tesla")
-    st.success("📞 **Yesterday:** Interview confirmed with Google")
-    st.warning("⏰ **Reminder:** Microsoft interview tomorrow at 2 PM")
+    st.markdown(_RECENT_NOTIFICATIONS_MD, unsafe_allow_html=True)
     
     # Gmail settings
     st.markdown("### ⚙️ Email Settings")
@@ -1215,200 +681,215 @@ def render_notifications_center():
     if st.button("💾 Save Settings"):
         st.success("✅ Email preferences updated!")
 
+_FEATURES_PAGE_LEFT_MD = """
+### 🤖 AI-Powered Automation
+- **24/7 Job Discovery:** Scans 50+ job boards continuously
+- **Smart Matching:** AI analyzes job requirements vs your skills
+- **Auto-Application:** Applies to relevant positions automatically
+- **Resume Tailoring:** Customizes resume for each application
+
+### 📊 Market Intelligence
+- **Salary Insights:** Real-time compensation data
+- **Skill Trends:** Most in-demand skills in your field
+- **Company Analysis:** Insider info on hiring companies
+- **Location Data:** Best cities for your career goals
+"""
+
+_FEATURES_PAGE_RIGHT_MD = """
+### 🎯 Career Planning
+- **Timeline Assessment:** Based on graduation date
+- **Skill Gap Analysis:** What to learn for dream job
+- **Career Roadmap:** Step-by-step progression plan
+- **Interview Prep:** AI-generated practice questions
+
+### 📧 Smart Notifications
+- **Gmail Integration:** Seamless email notifications
+- **Interview Alerts:** Never miss an opportunity
+- **Progress Reports:** Weekly career advancement updates
+- **Job Matches:** Instant alerts for perfect opportunities
+"""
+
 def render_features_page():
     """Render the features page"""
-    st.markdown("# ⚡ AI Career Agent Features")
-    st.markdown("### Discover the power of AI-driven career acceleration")
+    st.markdown("# ⚡ AI Career Agent Features\n\n### Discover the power of AI-driven career acceleration")
     
     # Feature cards
     col1, col2 = st.columns(2)
     
     with col1:
-        st.markdown("""
-        ### 🤖 AI-Powered Automation
-        - **24/7 Job Discovery:** Scans 50+ job boards continuously
-        - **Smart Matching:** AI analyzes job requirements vs your skills
-        - **Auto-Application:** Applies to relevant positions automatically
-        - **Resume Tailoring:** Customizes resume for each application
-        """)
-        
-        st.markdown("""
-        ### 📊 Market Intelligence
-        - **Salary Insights:** Real-time compensation data
-        - **Skill Trends:** Most in-demand skills in your field
-        - **Company Analysis:** Insider info on hiring companies
-        - **Location Data:** Best cities for your career goals
-        """)
+        st.markdown(_FEATURES_PAGE_LEFT_MD)
     
     with col2:
-        st.markdown("""
-        ### 🎯 Career Planning
-        - **Timeline Assessment:** Based on graduation date
-        - **Skill Gap Analysis:** What to learn for dream job
-        - **Career Roadmap:** Step-by-step progression plan
-        - **Interview Prep:** AI-generated practice questions
-        """)
-        
-        st.markdown("""
-        ### 📧 Smart Notifications
-        - **Gmail Integration:** Seamless email notifications
-        - **Interview Alerts:** Never miss an opportunity
-        - **Progress Reports:** Weekly career advancement updates
-        - **Job Matches:** Instant alerts for perfect opportunities
-        """)
+        st.markdown(_FEATURES_PAGE_RIGHT_MD)
     
     # CTA
     if st.button("🚀 Try These Features Now", type="primary", use_container_width=True):
         st.session_state.show_onboarding = True
         st.rerun()
 
+# Each step heading followed by its alert
+_STEPS_MD = "\n\n".join(f"## {title}\n\n" + _alert_list(((kind, body),)) for title, kind, body in (
+    ("Step 1: 📋 Tell Us About Yourself", 'info',
+     "Share your graduation timeline, dream job, and career preferences. Our AI uses this to personalize everything."),
+    ("Step 2: 🤖 AI Gets to Work", 'success',
+     "While you focus on studies/interviews, our AI scans job boards, optimizes your resume, and applies to relevant positions."),
+    ("Step 3: 📞 Interview Coordination", 'warning',
+     "When companies respond, we automatically schedule interviews based on your availability and send you prep materials."),
+    ("Step 4: 🎉 Land Your Dream Job", 'success',
+     "With AI handling the heavy lifting, you get more interviews and better job offers in less time.")
+))
+
+_PROCESS_METRICS_HTML = _metrics_row((
+    ("Jobs Scanned Daily", "10,000+", "Across 50+ platforms"),
+    ("Applications Sent", "Average 15/day", "Tailored for each role"),
+    ("Success Rate", "3x Higher", "vs manual applications")
+))
+
 def render_how_it_works_page():
     """Render the how it works page"""
-    st.markdown("# 🔄 How AI Career Agent Works")
-    st.markdown("### Your journey from student to employed in 4 simple steps")
+    st.markdown("# 🔄 How AI Career Agent Works\n\n### Your journey from student to employed in 4 simple steps")
     
     # Step-by-step process
-    st.markdown("## Step 1: 📋 Tell Us About Yourself")
-    st.info("Share your graduation timeline, dream job, and career preferences. Our AI uses this to personalize everything.")
-    
-    st.markdown("## Step 2: 🤖 AI Gets to Work")
-    st.success("While you focus on studies/interviews, our AI scans job boards, optimizes your resume, and applies to relevant positions.")
-    
-    st.markdown("## Step 3: 📞 Interview Coordination")
-    st.warning("When companies respond, we automatically schedule interviews based on your availability and send you prep materials.")
-    
-    st.markdown("## Step 4: 🎉 Land Your Dream Job")
-    st.success("With AI handling the heavy lifting, you get more interviews and better job offers in less time.")
+    st.markdown(_STEPS_MD, unsafe_allow_html=True)
     
     # Process visualization
     st.markdown("### 🔄 The AI Process")
     
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.metric("Jobs Scanned Daily", "10,000+", "Across 50+ platforms")
-    with col2:
-        st.metric("Applications Sent", "Average 15/day", "Tailored for each role")
-    with col3:
-        st.metric("Success Rate", "3x Higher", "vs manual applications")
+    st.markdown(_PROCESS_METRICS_HTML, unsafe_allow_html=True)
+
+_SUCCESS_STORIES_LEFT_MD = """
+### 👨‍💻 Alex Chen - Software Engineer at Google
+**Timeline:** 3 months before graduation
+
+*"I was stressed about job hunting while finishing my CS degree. AI Career Agent found and applied to 200+ positions while I focused on finals. Got 15 interviews and landed my dream job at Google!"*
+
+**Results:**
+- 📝 200+ applications sent automatically
+- 📞 15 interviews scheduled
+- 💰 $165K starting salary
+- ⏱️ 2 weeks from graduation to job offer
+
+### 👩‍🔬 Sarah Johnson - Data Scientist at Microsoft
+**Timeline:** Recent graduate, 6 months job searching
+
+*"After 6 months of manual applications with no luck, I tried AI Career Agent. Within 3 weeks, I had multiple offers including Microsoft!"*
+
+**Results:**
+- 🎯 85% application response rate
+- 📊 5 job offers in 3 weeks
+- 💰 $145K + equity package
+- 🚀 Career acceleration beyond expectations
+"""
+
+_SUCCESS_STORIES_RIGHT_MD = """
+### 👨‍💼 Marcus Williams - Product Manager at Meta
+**Timeline:** Career changer from finance
+
+*"Switching from finance to tech seemed impossible. AI Career Agent identified transferable skills and positioned me perfectly for PM roles."*
+
+**Results:**
+- 🔄 Successful career transition
+- 📈 40% salary increase from finance
+- 🎯 Landed at top-tier tech company
+- 💡 AI identified hidden opportunities
+
+### 👩‍💻 Emily Rodriguez - Full-Stack Developer at Startup
+**Timeline:** Bootcamp graduate, no CS degree
+
+*"As a bootcamp grad competing with CS majors, I needed an edge. AI Career Agent highlighted my projects perfectly and got me noticed."*
+
+**Results:**
+- 🎓 Overcame education gap
+- 💼 Multiple startup offers
+- 📈 $95K starting salary
+- 🚀 Fast-track to senior roles
+"""
+
+_SUCCESS_METRICS_HTML = _metrics_row((
+    ("Students Helped", "2,500+", "And growing daily"),
+    ("Average Time to Offer", "3.2 weeks", "vs 4.5 months manual"),
+    ("Success Rate", "94%", "Land job within 90 days"),
+    ("Salary Increase", "+23%", "vs manual applications")
+))
 
 def render_success_stories_page():
     """Render the success stories page"""
-    st.markdown("# 🏆 Success Stories")
-    st.markdown("### Real students who landed their dream jobs with AI Career Agent")
+    st.markdown("# 🏆 Success Stories\n\n### Real students who landed their dream jobs with AI Career Agent")
     
     # Success story cards
     col1, col2 = st.columns(2)
     
     with col1:
-        st.markdown("""
-        ### 👨‍💻 Alex Chen - Software Engineer at Google
-        **Timeline:** 3 months before graduation
-        
-        *"I was stressed about job hunting while finishing my CS degree. AI Career Agent found and applied to 200+ positions while I focused on finals. Got 15 interviews and landed my dream job at Google!"*
-        
-        **Results:**
-        - 📝 200+ applications sent automatically
-        - 📞 15 interviews scheduled
-        - 💰 $165K starting salary
-        - ⏱️ 2 weeks from graduation to job offer
-        """)
-        
-        st.markdown("""
-        ### 👩‍🔬 Sarah Johnson - Data Scientist at Microsoft
-        **Timeline:** Recent graduate, 6 months job searching
-        
-        *"After 6 months of manual applications with no luck, I tried AI Career Agent. Within 3 weeks, I had multiple offers including Microsoft!"*
-        
-        **Results:**
-        - 🎯 85% application response rate
-        - 📊 5 job offers in 3 weeks
-        - 💰 $145K + equity package
-        - 🚀 Career acceleration beyond expectations
-        """)
+        st.markdown(_SUCCESS_STORIES_LEFT_MD)
     
     with col2:
-        st.markdown("""
-        ### 👨‍💼 Marcus Williams - Product Manager at Meta
-        **Timeline:** Career changer from finance
-        
-        *"Switching from finance to tech seemed impossible. AI Career Agent identified transferable skills and positioned me perfectly for PM roles."*
-        
-        **Results:**
-        - 🔄 Successful career transition
-        - 📈 40% salary increase from finance
-        - 🎯 Landed at top-tier tech company
-        - 💡 AI identified hidden opportunities
-        """)
-        
-        st.markdown("""
-        ### 👩‍💻 Emily Rodriguez - Full-Stack Developer at Startup
-        **Timeline:** Bootcamp graduate, no CS degree
-        
-        *"As a bootcamp grad competing with CS majors, I needed an edge. AI Career Agent highlighted my projects perfectly and got me noticed."*
-        
-        **Results:**
-        - 🎓 Overcame education gap
-        - 💼 Multiple startup offers
-        - 📈 $95K starting salary
-        - 🚀 Fast-track to senior roles
-        """)
+        st.markdown(_SUCCESS_STORIES_RIGHT_MD)
     
     # Statistics
     st.markdown("### 📊 Overall Success Metrics")
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.metric("Students Helped", "2,500+", "And growing daily")
-    with col2:
-        st.metric("Average Time to Offer", "3.2 weeks", "vs 4.5 months manual")
-    with col3:
-        st.metric("Success Rate", "94%", "Land job within 90 days")
-    with col4:
-        st.metric("Salary Increase", "+23%", "vs manual applications")
+    st.markdown(_SUCCESS_METRICS_HTML, unsafe_allow_html=True)
+
+_PRICING_FREE_MD = """
+### 🆓 Free Trial
+**Perfect for testing the waters**
+
+**$0** for 7 days
+
+✅ 5 job applications per day
+✅ Basic resume optimization
+✅ Email notifications
+✅ Career timeline assessment
+❌ Premium job boards
+❌ Interview scheduling
+❌ Advanced analytics
+"""
+
+_PRICING_STUDENT_MD = """
+### 🚀 Student Plan
+**Most popular for active job seekers**
+
+**$29/month** or $290/year (save 17%)
+
+✅ Unlimited job applications
+✅ Advanced resume optimization
+✅ All job boards (50+ platforms)
+✅ Interview scheduling
+✅ Gmail integration
+✅ Weekly progress reports
+✅ Priority support
+"""
+
+_PRICING_PRO_MD = """
+### 💼 Professional Plan
+**For career changers & experienced professionals**
+
+**$49/month** or $490/year (save 17%)
+
+✅ Everything in Student Plan
+✅ Executive job boards
+✅ Salary negotiation support
+✅ Personal career coach
+✅ LinkedIn optimization
+✅ Network introductions
+✅ White-glove service
+"""
 
 def render_pricing_page():
     """Render the pricing page"""
-    st.markdown("# 💰 Pricing Plans")
-    st.markdown("### Choose the plan that fits your career timeline")
+    st.markdown("# 💰 Pricing Plans\n\n### Choose the plan that fits your career timeline")
     
     # Pricing cards
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        st.markdown("""
-        ### 🆓 Free Trial
-        **Perfect for testing the waters**
-        
-        **$0** for 7 days
-        
-        ✅ 5 job applications per day
-        ✅ Basic resume optimization
-        ✅ Email notifications
-        ✅ Career timeline assessment
-        ❌ Premium job boards
-        ❌ Interview scheduling
-        ❌ Advanced analytics
-        """)
+        st.markdown(_PRICING_FREE_MD)
         
         if st.button("Start Free Trial", key="pricing_free", use_container_width=True):
             st.session_state.show_onboarding = True
             st.rerun()
     
     with col2:
-        st.markdown("""
-        ### 🚀 Student Plan
-        **Most popular for active job seekers**
-        
-        **$29/month** or $290/year (save 17%)
-        
-        ✅ Unlimited job applications
-        ✅ Advanced resume optimization
-        ✅ All job boards (50+ platforms)
-        ✅ Interview scheduling
-        ✅ Gmail integration
-        ✅ Weekly progress reports
-        ✅ Priority support
-        """)
+        st.markdown(_PRICING_STUDENT_MD)
         
         if st.button("Choose Student Plan", key="pricing_student", type="primary", use_container_width=True):
             st.success("🎉 Student Plan selected! Complete onboarding to activate.")
@@ -1416,20 +897,7 @@ def render_pricing_page():
             st.rerun()
     
     with col3:
-        st.markdown("""
-        ### 💼 Professional Plan
-        **For career changers & experienced professionals**
-        
-        **$49/month** or $490/year (save 17%)
-        
-        ✅ Everything in Student Plan
-        ✅ Executive job boards
-        ✅ Salary negotiation support
-        ✅ Personal career coach
-        ✅ LinkedIn optimization
-        ✅ Network introductions
-        ✅ White-glove service
-        """)
+        st.markdown(_PRICING_PRO_MD)
         
         if st.button("Choose Professional", key="pricing_pro", use_container_width=True):
             st.success("💼 Professional Plan selected! Complete onboarding to activate.")
@@ -1448,10 +916,56 @@ def render_pricing_page():
     with st.expander("What if I don't get a job?"):
         st.write("We offer a 90-day job guarantee. If you don't get at least 3 interviews in 90 days, we'll refund your money.")
 
+_ABOUT_TEAM_CEO_MD = """
+### 🧠 Dr. Sarah Chen
+**CEO & Co-Founder**
+
+Former Google AI researcher with 10+ years in machine learning. PhD from Stanford. 
+Passionate about using AI to solve real-world problems.
+"""
+
+_ABOUT_TEAM_CTO_MD = """
+### 💼 Marcus Johnson
+**CTO & Co-Founder**
+
+Ex-Microsoft engineer who built career platforms at scale. 
+Expert in job market data and recruitment automation.
+"""
+
+_ABOUT_TEAM_SUCCESS_MD = """
+### 🎓 Emily Rodriguez
+**Head of Student Success**
+
+Former university career counselor who helped 1000+ students land jobs. 
+Understands the unique challenges students face.
+"""
+
+_ABOUT_VALUES_LEFT_MD = """
+### 🎯 Student-First
+Every decision we make prioritizes student success over profits.
+
+### 🤖 AI for Good
+We use cutting-edge AI to solve meaningful problems, not create them.
+"""
+
+_ABOUT_VALUES_RIGHT_MD = """
+### 🌍 Accessibility
+Career success shouldn't depend on your network or background.
+
+### 📈 Continuous Innovation
+We're constantly improving our AI to serve students better.
+"""
+
+_COMPANY_METRICS_HTML = _metrics_row((
+    ("Founded", "2023", "Y Combinator S23"),
+    ("Students Helped", "2,500+", "Across 200+ universities"),
+    ("Job Placements", "2,350+", "94% success rate"),
+    ("Funding Raised", "$5.2M", "Series A led by Andreessen Horowitz")
+))
+
 def render_about_page():
     """Render the about us page"""
-    st.markdown("# 👥 About AI Career Agent")
-    st.markdown("### Empowering the next generation of professionals with AI")
+    st.markdown("# 👥 About AI Career Agent\n\n### Empowering the next generation of professionals with AI")
     
     # Mission
     st.markdown("## 🎯 Our Mission")
@@ -1468,45 +982,18 @@ def render_about_page():
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        st.markdown("""
-        ### 🧠 Dr. Sarah Chen
-        **CEO & Co-Founder**
-        
-        Former Google AI researcher with 10+ years in machine learning. PhD from Stanford. 
-        Passionate about using AI to solve real-world problems.
-        """)
+        st.markdown(_ABOUT_TEAM_CEO_MD)
     
     with col2:
-        st.markdown("""
-        ### 💼 Marcus Johnson
-        **CTO & Co-Founder**
-        
-        Ex-Microsoft engineer who built career platforms at scale. 
-        Expert in job market data and recruitment automation.
-        """)
+        st.markdown(_ABOUT_TEAM_CTO_MD)
     
     with col3:
-        st.markdown("""
-        ### 🎓 Emily Rodriguez
-        **Head of Student Success**
-        
-        Former university career counselor who helped 1000+ students land jobs. 
-        Understands the unique challenges students face.
-        """)
+        st.markdown(_ABOUT_TEAM_SUCCESS_MD)
     
     # Company stats
     st.markdown("## 📊 Company Highlights")
     
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.metric("Founded", "2023", "Y Combinator S23")
-    with col2:
-        st.metric("Students Helped", "2,500+", "Across 200+ universities")
-    with col3:
-        st.metric("Job Placements", "2,350+", "94% success rate")
-    with col4:
-        st.metric("Funding Raised", "$5.2M", "Series A led by Andreessen Horowitz")
+    st.markdown(_COMPANY_METRICS_HTML, unsafe_allow_html=True)
     
     # Values
     st.markdown("## 💡 Our Values")
@@ -1514,169 +1001,70 @@ def render_about_page():
     col1, col2 = st.columns(2)
     
     with col1:
-        st.markdown("""
-        ### 🎯 Student-First
-        Every decision we make prioritizes student success over profits.
-        
-        ### 🤖 AI for Good
-        We use cutting-edge AI to solve meaningful problems, not create them.
-        """)
+        st.markdown(_ABOUT_VALUES_LEFT_MD)
     
     with col2:
-        st.markdown("""
-        ### 🌍 Accessibility
-        Career success shouldn't depend on your network or background.
-        
-        ### 📈 Continuous Innovation
-        We're constantly improving our AI to serve students better.
-        """)
+        st.markdown(_ABOUT_VALUES_RIGHT_MD)
 
 def render_landing_page():
     """Render the complete landing page"""
     
-    # Hero Section
-    st.markdown("""
-    <div class="hero-section">
-        <div class="hero-container">
-            <div class="hero-content">
-                <div class="hero-tagline">YOUR AI-POWERED CAREER PARTNER</div>
-                <h1 class="hero-title">Land Your Dream Job Without Limits</h1>
-                <p class="hero-subtitle">
-                    AI-powered career acceleration for students and graduates. 
-                    We handle job search, applications, and interview prep automatically.
-                </p>
-                <ul class="hero-features">
-                    <li>Automated job discovery across 50+ platforms daily</li>
-                    <li>AI-optimized resumes tailored for each application</li>
-                    <li>Smart interview scheduling and preparation</li>
-                    <li>Real-time market intelligence and salary insights</li>
-                </ul>
-                <div class="hero-actions">
-                    <button class="primary-cta">🚀 START YOUR CAREER JOURNEY</button>
-                    <div class="social-links">
-                        <a href="#" class="social-link">📧</a>
-                        <a href="#" class="social-link">💼</a>
-                        <a href="#" class="social-link">🐦</a>
-                        <a href="#" class="social-link">📱</a>
-                    </div>
-                </div>
-            </div>
-            <div class="hero-visual">
-                <div class="ai-dashboard">
-                    <div class="dashboard-header">
-                        <div class="dashboard-title">🤖 AI Career Agent</div>
-                        <div class="ai-status">
-                            <div class="status-dot"></div>
-                            AI Working
-                        </div>
-                    </div>
-                    <div class="dashboard-content">
-                        <div class="ai-metric">
-                            <span>🎯 Jobs Found Today</span>
-                            <span class="metric-value">23</span>
-                        </div>
-                        <div class="ai-metric">
-                            <span>📝 Applications Sent</span>
-                            <span class="metric-value">12</span>
-                        </div>
-                        <div class="ai-metric">
-                            <span>📞 Interviews Scheduled</span>
-                            <span class="metric-value">4</span>
-                        </div>
-                        <div class="ai-metric">
-                            <span>✅ Response Rate</span>
-                            <span class="metric-value">34%</span>
-                        </div>
-                    </div>
-                </div>
-            </div>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Interactive CTA Buttons
-    col1, col2, col3 = st.columns([1, 2, 1])
-    with col2:
-        if st.button("🚀 START FREE TRIAL", use_container_width=True, type="primary"):
-            st.session_state.show_onboarding = True
-            st.rerun()
+    # Hero, features, stats and closing CTA copy in a single static block
+    st.markdown(_HERO_HTML + _FEATURES_HTML + _STATS_HTML + _CTA_HTML, unsafe_allow_html=True)
     
-    # Features Section
-    st.markdown("""
-    <div class="features-section">
-        <div class="features-container">
-            <h2 class="section-title">Why Choose AI Career Agent?</h2>
-            <p class="section-subtitle">
-                We combine cutting-edge AI with deep career expertise to give you an unfair advantage in today's competitive job market.
-            </p>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Stats Section
-    st.markdown("""
-    <div class="stats-section">
-        <div class="stats-container">
-            <div class="stat-item">
-                <div class="stat-number">95%</div>
-                <div class="stat-label">Job Match Accuracy</div>
-            </div>
-            <div class="stat-item">
-                <div class="stat-number">3x</div>
-                <div class="stat-label">Faster Job Placement</div>
-            </div>
-            <div class="stat-item">
-                <div class="stat-number">50+</div>
-                <div class="stat-label">Job Boards Monitored</div>
-            </div>
-            <div class="stat-item">
-                <div class="stat-number">24/7</div>
-                <div class="stat-label">AI Agent Working</div>
-            </div>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Final CTA
-    col1, col2, col3 = st.columns([1, 2, 1])
-    with col2:
-        if st.button("🎓 START YOUR SUCCESS STORY", use_container_width=True, type="primary"):
-            st.session_state.show_onboarding = True
-            st.rerun()
+    # The free trial button lives in the navigation bar; only the closing CTA is repeated here
+    _render_final_cta()
+
+# Page routing tables; defined after the render functions they reference
+_MAIN_PAGES = {
+    'Home': render_home_dashboard,
+    'Dashboard': render_analytics_dashboard,
+    'Jobs': render_jobs_page,
+    'Career Plan': render_career_planning,
+    'Resume': render_resume_tools,
+    'Notifications': render_notifications_center
+}
+
+_NAV_PAGES = {
+    'home': render_landing_page,
+    'features': render_features_page,
+    'how_it_works': render_how_it_works_page,
+    'success_stories': render_success_stories_page,
+    'pricing': render_pricing_page,
+    'about': render_about_page
+}
+
+# Per-session state keys and their initial values
+_SESSION_DEFAULTS = (
+    ('show_onboarding', False),
+    ('onboarding_completed', False),
+    ('show_main_app', False),
+    ('current_page', 'Home')
+)
 
 def main():
     """Main application entry point with page routing"""
     
-    # Initialize current page
+    # Seed session defaults once so the rest of the script reads attributes directly
+    for key, value in _SESSION_DEFAULTS:
+        st.session_state.setdefault(key, value)
+    
+    # A fresh session starts on the page named by ?nav=, if any
     if 'current_nav_page' not in st.session_state:
-        st.session_state.current_nav_page = 'home'
+        nav_page = st.query_params.get('nav', 'home')
+        st.session_state.current_nav_page = nav_page if nav_page in _NAV_LINKS else 'home'
     
     # Always show navigation header
     render_navigation()
     
     # Check which view to show
-    if st.session_state.get('show_main_app', False):
+    if st.session_state.show_main_app:
         render_main_app()
-    elif st.session_state.get('show_onboarding', False):
+    elif st.session_state.show_onboarding:
         render_onboarding_flow()
     else:
         # Route to different pages based on navigation
-        current_page = st.session_state.get('current_nav_page', 'home')
-        
-        if current_page == 'home':
-            render_landing_page()
-        elif current_page == 'features':
-            render_features_page()
-        elif current_page == 'how_it_works':
-            render_how_it_works_page()
-        elif current_page == 'success_stories':
-            render_success_stories_page()
-        elif current_page == 'pricing':
-            render_pricing_page()
-        elif current_page == 'about':
-            render_about_page()
-        else:
-            render_landing_page()  # Default fallback
+        _NAV_PAGES.get(st.session_state.current_nav_page, render_landing_page)()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
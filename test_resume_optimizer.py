@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the resume optimizer Lambda's reply parsing
+"""
+
+import os
+import sys
+
+import pytest
+
+# The module builds its boto3 clients at import; they only need a region
+os.environ.setdefault('AWS_DEFAULT_REGION', 'us-east-1')
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'lambda_functions'))
+
+from resume_optimizer import _extract_json
+
+
+@pytest.mark.parametrize('reply, expected', [
+    ('{"a": 1}', {'a': 1}),
+    ('Here is the result: {"a": {"b": "}"}} Hope it helps!', {'a': {'b': '}'}}),
+    # Braces in the prose before the JSON object
+    ('use {placeholder} then {"a":1}', {'a': 1}),
+    ('an unclosed { brace, then {"a": 1}', {'a': 1}),
+    ('no JSON here', None),
+    ('only {placeholder} braces', None),
+])
+def test_extract_json(reply, expected):
+    assert _extract_json(reply) == expected
@@ -1,10 +1,57 @@
 # Add these imports to your Lambda function
-from aws_xray_sdk.core import xray_recorder
-from aws_xray_sdk.core import patch_all
 import boto3
+from botocore.config import Config
+import collections
+import contextlib
+import functools
+import io
+import json
+import os
+from datetime import datetime
 
-# Patch AWS SDK calls for X-Ray tracing
-patch_all()
+if os.environ.get('AWS_XRAY_DAEMON_ADDRESS'):
+    from aws_xray_sdk.core import xray_recorder
+    from aws_xray_sdk.core import patch_all
+    
+    # Patch AWS SDK calls for X-Ray tracing
+    patch_all()
+else:
+    # Tracing is off: skip the SDK import and patch_all() on cold start
+    class _NoopRecorder:
+        """Stand-in for xray_recorder when no X-Ray daemon is configured"""
+        
+        def capture(self, name=None):
+            return lambda func: func
+        
+        def put_annotation(self, key, value):
+            pass
+        
+        def put_metadata(self, key, value, namespace='default'):
+            pass
+        
+        def in_subsegment(self, name=None, **kwargs):
+            return contextlib.nullcontext()
+    
+    xray_recorder = _NoopRecorder()
+
+# Clients are created once per container (after patch_all so they are traced)
+# and reused across warm invocations. TCP keep-alive avoids a fresh TLS
+# handshake after idle gaps; a larger pool keeps concurrent subsegments from
+# churning connections
+CLIENT_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=50,
+    connect_timeout=2,
+    read_timeout=30,
+    retries={'mode': 'adaptive', 'max_attempts': 5}
+)
+BEDROCK_RUNTIME = boto3.client('bedrock-runtime', config=CLIENT_CONFIG)
+DYNAMODB = boto3.resource('dynamodb', config=CLIENT_CONFIG)
+
+@functools.lru_cache(maxsize=None)
+def get_table(table_name):
+    """Cached DynamoDB Table resource"""
+    return DYNAMODB.Table(table_name)
 
 @xray_recorder.capture('lambda_handler')
 def lambda_handler(event, context):
@@ -36,6 +83,32 @@ def lambda_handler(event, context):
         })
         raise
 
+# Distinct (model, prompt) pairs whose responses are kept per warm container
+AI_RESPONSE_CACHE_SIZE = 256
+
+# (body bytes, response fields such as contentType), least recently used first.
+# ResponseMetadata belongs to the original call, so hits get a stub instead
+_AI_RESPONSE_CACHE = collections.OrderedDict()
+
+# ResponseMetadata returned on a cache hit: same keys as a real response, no request id
+_CACHED_RESPONSE_METADATA = {
+    'RequestId': '',
+    'HTTPStatusCode': 200,
+    'HTTPHeaders': {},
+    'RetryAttempts': 0
+}
+
+def _invoke_model(model_id, prompt):
+    """Single-turn invoke_model call for the given model and prompt"""
+    return BEDROCK_RUNTIME.invoke_model(
+        modelId=model_id,
+        body=json.dumps({
+            'anthropic_version': 'bedrock-2023-05-31',
+            'max_tokens': 1000,
+            'messages': [{'role': 'user', 'content': prompt}]
+        }, separators=(',', ':')).encode('utf-8')
+    )
+
 @xray_recorder.capture('bedrock_ai_call')
 def call_bedrock_ai(prompt, model_id):
     """
@@ -46,21 +119,30 @@ def call_bedrock_ai(prompt, model_id):
     xray_recorder.put_annotation("ai_model", model_id)
     xray_recorder.put_annotation("prompt_length", len(prompt))
     
-    bedrock_runtime = boto3.client('bedrock-runtime')
-    
     try:
-        response = bedrock_runtime.invoke_model(
-            modelId=model_id,
-            body=json.dumps({
-                'anthropic_version': 'bedrock-2023-05-31',
-                'max_tokens': 1000,
-                'messages': [{'role': 'user', 'content': prompt}]
-            })
-        )
+        key = (model_id, prompt)
+        cached = _AI_RESPONSE_CACHE.get(key)
+        cache_hit = cached is not None
+        xray_recorder.put_annotation("ai_cache_hit", cache_hit)
+        
+        if cache_hit:
+            _AI_RESPONSE_CACHE.move_to_end(key)
+            raw, fields = cached
+            response_metadata = dict(_CACHED_RESPONSE_METADATA, HTTPHeaders={})
+        else:
+            # Errors propagate before anything is cached
+            response = _invoke_model(model_id, prompt)
+            raw = response['body'].read()
+            response_metadata = response.get('ResponseMetadata', {})
+            fields = {k: v for k, v in response.items() if k not in ('body', 'ResponseMetadata')}
+            _AI_RESPONSE_CACHE[key] = (raw, fields)
+            if len(_AI_RESPONSE_CACHE) > AI_RESPONSE_CACHE_SIZE:
+                _AI_RESPONSE_CACHE.popitem(last=False)
         
         # Add success metadata
-        xray_recorder.put_metadata("ai_response_size", len(response['body'].read()))
-        return response
+        xray_recorder.put_metadata("ai_response_size", len(raw))
+        # Same keys on hits and misses; each caller gets its own stream over the shared bytes
+        return {'ResponseMetadata': response_metadata, **fields, 'body': io.BytesIO(raw)}
         
     except Exception as e:
         xray_recorder.put_annotation("ai_error", str(e))
@@ -75,29 +157,59 @@ def store_in_dynamodb(table_name, item):
     xray_recorder.put_annotation("table_name", table_name)
     xray_recorder.put_annotation("operation", "put_item")
     
-    dynamodb = boto3.resource('dynamodb')
-    table = dynamodb.Table(table_name)
+    return get_table(table_name).put_item(Item=item)
+
+@xray_recorder.capture('database_batch_operation')
+def store_many_in_dynamodb(table_name, items):
+    """
+    Batched DynamoDB writes with X-Ray tracing (up to 25 items per request,
+    unprocessed items are retried by the batch writer)
+    """
+    
+    xray_recorder.put_annotation("table_name", table_name)
+    xray_recorder.put_annotation("operation", "batch_write_item")
     
-    return table.put_item(Item=item)
+    count = 0
+    with get_table(table_name).batch_writer() as batch:
+        for item in items:
+            batch.put_item(Item=item)
+            count += 1
+    
+    xray_recorder.put_metadata("items_written", count)
+    return count
+
+# Record eventSource values mapped to trigger names
+EVENT_SOURCES = {
+    'aws:s3': 's3',
+    'aws:dynamodb': 'dynamodb_stream',
+    'aws:sns': 'sns',
+    'aws:sqs': 'sqs'
+}
 
 def determine_event_source(event):
     """Determine the source of the Lambda trigger"""
     
-    if 'httpMethod' in event:
+    if 'httpMethod' in event or 'requestContext' in event:
         return 'api_gateway'
-    elif 'Records' in event:
-        if 's3' in event['Records'][0]:
+    
+    records = event.get('Records')
+    if records:
+        record = records[0]
+        # SNS records spell it EventSource; fall back to payload keys if neither is present
+        source = EVENT_SOURCES.get(record.get('eventSource') or record.get('EventSource'))
+        if source:
+            return source
+        if 's3' in record:
             return 's3'
-        elif 'dynamodb' in event['Records'][0]:
+        if 'dynamodb' in record:
             return 'dynamodb_stream'
-        elif 'Sns' in event['Records'][0]:
+        if 'Sns' in record:
             return 'sns'
-        elif 'eventSource' in event['Records'][0] and 'sqs' in event['Records'][0]['eventSource']:
-            return 'sqs'
-    elif 'source' in event and event['source'] == 'aws.events':
-        return 'eventbridge'
-    else:
         return 'unknown'
+    
+    if event.get('source') == 'aws.events':
+        return 'eventbridge'
+    return 'unknown'
 
 # Example of how to use X-Ray subsegments for detailed tracing
 @xray_recorder.capture('process_job_search')